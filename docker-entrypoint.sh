@@ -4,6 +4,13 @@
 set -e
 
 echo "Starting website change tracker..."
+
+# If an API port is configured, run the scheduler and HTTP API in a single process
+if [ -n "$API_PORT" ]; then
+    echo "HTTP API enabled on port $API_PORT"
+    exec python -m website_change_tracker.server
+fi
+
 echo "Script will run every half hour"
 
 # Function to run the tracker
@@ -0,0 +1,149 @@
+"""
+Tests for the HTTP API in website_change_tracker.server.
+The Chromium check is replaced with a stub, so no browser is needed.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from website_change_tracker import server, alert_if_missing_text
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    """Run each test in a temp dir with a config.json and a log directory."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "log").mkdir()
+    (tmp_path / "config.json").write_text(
+        json.dumps({"url_to_track": "https://example.com", "string_to_search": "hello"}),
+        encoding="utf-8",
+    )
+
+
+def stub_checks(monkeypatch, outcomes):
+    """Make alert_if_missing_text.main return (or raise) each outcome in turn."""
+    outcomes = iter(outcomes)
+
+    def fake_main(print_logs=False):
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(alert_if_missing_text, "main", fake_main)
+
+
+async def send(port: int, raw: bytes) -> tuple[int, object]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(raw)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    return status, json.loads(body)
+
+
+def run_requests(tracker: server.Tracker, *requests: bytes) -> list[tuple[int, object]]:
+    async def go():
+        srv = await asyncio.start_server(server.make_handler(tracker), "127.0.0.1", 0)
+        port = srv.sockets[0].getsockname()[1]
+        async with srv:
+            return [await send(port, raw) for raw in requests]
+
+    return asyncio.run(go())
+
+
+def test_routing(monkeypatch):
+    stub_checks(monkeypatch, [True])
+    responses = run_requests(
+        server.Tracker(),
+        b"POST /check HTTP/1.1\r\nContent-Length: 2\r\n\r\n{}",
+        b"GET /status HTTP/1.1\r\n\r\n",
+        b"GET /results/ HTTP/1.1\r\n\r\n",
+        b"GET /check HTTP/1.1\r\n\r\n",
+        b"GET /nope HTTP/1.1\r\n\r\n",
+        b"garbage\r\n\r\n",
+    )
+    statuses = [status for status, _ in responses]
+    assert statuses == [200, 200, 200, 405, 404, 400]
+
+    check = responses[0][1]
+    assert check["target"] == "https://example.com"
+    assert check["state"] == "found"
+    assert responses[1][1]["targets"]["https://example.com"]["last_state"] == "found"
+    assert responses[2][1] == [check]
+
+
+def test_request_timeout(monkeypatch):
+    monkeypatch.setattr(server, "REQUEST_TIMEOUT", 0.1)
+    # No blank line terminating the headers
+    [(status, body)] = run_requests(server.Tracker(), b"GET /status HTTP/1.1\r\n")
+    assert status == 408
+
+
+def test_results_ring_buffer(monkeypatch):
+    stub_checks(monkeypatch, [True, False, True, False])
+    tracker = server.Tracker(history_size=3)
+
+    async def go():
+        return [await tracker.run_check() for _ in range(4)]
+
+    results = asyncio.run(go())
+    assert tracker.results() == results[1:]
+
+
+def test_last_change(monkeypatch):
+    stub_checks(monkeypatch, [True, True, False])
+    tracker = server.Tracker()
+
+    async def go():
+        return [await tracker.run_check() for _ in range(3)]
+
+    _, _, third = asyncio.run(go())
+    target = tracker.status()["targets"]["https://example.com"]
+    assert target["last_change"] == third["checked_at"]
+    assert target["last_checked"] == third["checked_at"]
+
+
+def test_last_change_unchanged_when_state_repeats(monkeypatch):
+    stub_checks(monkeypatch, [True, True])
+    tracker = server.Tracker()
+
+    async def go():
+        return [await tracker.run_check() for _ in range(2)]
+
+    first, second = asyncio.run(go())
+    target = tracker.status()["targets"]["https://example.com"]
+    assert target["last_change"] == first["checked_at"]
+    assert target["last_checked"] == second["checked_at"]
+
+
+def test_check_error_is_recorded(monkeypatch):
+    stub_checks(monkeypatch, [True, RuntimeError("chromedriver not found"), None])
+    tracker = server.Tracker()
+
+    async def go():
+        return [await tracker.run_check() for _ in range(3)]
+
+    ok, raised, failed = asyncio.run(go())
+    assert raised["state"] == "error"
+    assert raised["error"] == "chromedriver not found"
+    assert failed["state"] == "error"
+    assert "error" not in failed
+    assert tracker.results() == [ok, raised, failed]
+
+    target = tracker.status()["targets"]["https://example.com"]
+    assert target["last_state"] == "error"
+    assert target["last_change"] == raised["checked_at"]
+
+
+def test_main_returns_none_when_driver_setup_fails(monkeypatch):
+    def broken_driver(*args, **kwargs):
+        raise RuntimeError("chromedriver not found")
+
+    monkeypatch.delenv("MY_USER_ID", raising=False)
+    monkeypatch.setattr(alert_if_missing_text, "setup_selenium_driver", broken_driver)
+    assert alert_if_missing_text.main() is None
@@ -119,7 +119,14 @@ def check_if_text_present(driver: webdriver.Chrome, url: str, search_string: str
         raise
 
 
-def main(print_logs: bool = False):
+def main(print_logs: bool = False) -> bool | None:
+    """Run a single check against the configured URL.
+
+    Returns:
+        bool | None: True if text is found, False if it is missing,
+        None if the check itself failed (including driver setup).
+        Errors reading config.json are raised.
+    """
     with open("config.json", "r", encoding="utf-8") as cfg_file:
         config = json.load(cfg_file)
     
@@ -130,17 +137,17 @@ def main(print_logs: bool = False):
     STRING_TO_SEARCH: str = config["string_to_search"]
     
     driver = None
+    text_found = None
 
     # Check environment variables first (for Docker), then config file
     CHROMIUM_BINARY = os.getenv("CHROMIUM_BINARY") or config.get("chromium_binary")
     CHROMEDRIVER_PATH = os.getenv("CHROMEDRIVER_PATH") or config.get("chromedriver_path")
     
-    if CHROMIUM_BINARY and CHROMEDRIVER_PATH:
-        driver = setup_selenium_driver(CHROMIUM_BINARY, CHROMEDRIVER_PATH)
-    else:
-        driver = setup_selenium_driver()
-
     try:
+        if CHROMIUM_BINARY and CHROMEDRIVER_PATH:
+            driver = setup_selenium_driver(CHROMIUM_BINARY, CHROMEDRIVER_PATH)
+        else:
+            driver = setup_selenium_driver()
 
         # Use Selenium to check if text is present (waits for it to appear)
         text_found = check_if_text_present(
@@ -170,6 +177,8 @@ def main(print_logs: bool = False):
         if driver:
             driver.quit()
 
+    return text_found
+
 
 if __name__ == "__main__":
     main(True)
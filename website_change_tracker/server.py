@@ -0,0 +1,182 @@
+"""
+Lightweight HTTP API that runs the tracker on a schedule and on demand.
+
+Endpoints:
+    GET  /status   Last state, last change and latency for each target
+    GET  /results  Most recent check results (newest last)
+    POST /check    Run a check now and return its result
+"""
+
+import asyncio, json, os, time
+from collections import deque
+from datetime import datetime
+from dotenv import load_dotenv
+from . import alert_if_missing_text
+
+load_dotenv()
+
+# Seconds a client has to send its request line and headers
+REQUEST_TIMEOUT = 10
+
+
+class Tracker:
+    def __init__(self, history_size: int = 50, print_logs: bool = False):
+        self._print_logs = print_logs
+        self._lock = asyncio.Lock()
+        self._targets: dict[str, dict] = {}
+        self._results: deque[dict] = deque(maxlen=history_size)
+
+    @staticmethod
+    def _current_target() -> str:
+        with open("config.json", "r", encoding="utf-8") as cfg_file:
+            return json.load(cfg_file)["url_to_track"]
+
+    async def run_check(self) -> dict:
+        # Only one Chromium instance at a time, queued requests wait their turn
+        async with self._lock:
+            started = time.monotonic()
+            error = None
+            try:
+                text_found = await asyncio.to_thread(alert_if_missing_text.main, self._print_logs)
+            except Exception as e:
+                alert_if_missing_text.log(f"Check failed: {str(e)}", self._print_logs)
+                text_found = None
+                error = str(e)
+            latency = round(time.monotonic() - started, 3)
+
+            if text_found is None:
+                state = "error"
+            else:
+                state = "found" if text_found else "missing"
+
+            try:
+                target = self._current_target()
+            except Exception:
+                target = None
+
+            timestamp = datetime.now().isoformat()
+            result = {
+                "target": target,
+                "state": state,
+                "checked_at": timestamp,
+                "latency": latency,
+            }
+            if error is not None:
+                result["error"] = error
+            self._results.append(result)
+
+            previous = self._targets.get(target)
+            last_change = timestamp
+            if previous is not None and previous["last_state"] == state:
+                last_change = previous["last_change"]
+            self._targets[target] = {
+                "last_state": state,
+                "last_checked": timestamp,
+                "last_change": last_change,
+                "latency": latency,
+            }
+            return result
+
+    def status(self) -> dict:
+        return {"busy": self._lock.locked(), "targets": self._targets}
+
+    def results(self) -> list[dict]:
+        return list(self._results)
+
+
+async def schedule_checks(tracker: Tracker, interval: int):
+    while True:
+        try:
+            await tracker.run_check()
+        except Exception as e:
+            alert_if_missing_text.log(f"Scheduled check failed: {str(e)}", True)
+        await asyncio.sleep(interval)
+
+
+async def read_request(reader: asyncio.StreamReader) -> tuple[str, str]:
+    request_line = (await reader.readline()).decode("latin-1").strip()
+    method, path, _ = request_line.split(" ", 2)
+
+    content_length = 0
+    while True:
+        line = (await reader.readline()).decode("latin-1").strip()
+        if not line:
+            break
+        name, _, value = line.partition(":")
+        if name.strip().lower() == "content-length":
+            content_length = int(value.strip())
+    # Request bodies are not used, but must be consumed
+    if content_length:
+        await reader.readexactly(content_length)
+
+    return method.upper(), path.split("?", 1)[0].rstrip("/") or "/"
+
+
+async def write_response(writer: asyncio.StreamWriter, status: str, payload):
+    body = json.dumps(payload).encode("utf-8")
+    headers = (
+        f"HTTP/1.1 {status}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n"
+        "\r\n"
+    )
+    writer.write(headers.encode("latin-1") + body)
+    await writer.drain()
+
+
+def make_handler(tracker: Tracker):
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            try:
+                method, path = await asyncio.wait_for(read_request(reader), REQUEST_TIMEOUT)
+            except TimeoutError:
+                await write_response(writer, "408 Request Timeout", {"error": "Request timed out"})
+                return
+            except (ValueError, asyncio.IncompleteReadError):
+                await write_response(writer, "400 Bad Request", {"error": "Malformed request"})
+                return
+
+            if path == "/status" and method == "GET":
+                await write_response(writer, "200 OK", tracker.status())
+            elif path == "/results" and method == "GET":
+                await write_response(writer, "200 OK", tracker.results())
+            elif path == "/check" and method == "POST":
+                await write_response(writer, "200 OK", await tracker.run_check())
+            elif path in ("/status", "/results", "/check"):
+                await write_response(writer, "405 Method Not Allowed", {"error": f"{method} not allowed on {path}"})
+            else:
+                await write_response(writer, "404 Not Found", {"error": f"Unknown path {path}"})
+        except Exception as e:
+            alert_if_missing_text.log(f"API error: {str(e)}", True)
+            try:
+                await write_response(writer, "500 Internal Server Error", {"error": str(e)})
+            except Exception:
+                pass
+        finally:
+            writer.close()
+
+    return handle
+
+
+async def serve(host: str, port: int, interval: int, history_size: int):
+    tracker = Tracker(history_size=history_size, print_logs=True)
+    server = await asyncio.start_server(make_handler(tracker), host, port)
+    alert_if_missing_text.log(f"API listening on {host}:{port}, checking every {interval}s", True)
+    async with server:
+        await asyncio.gather(
+            server.serve_forever(),
+            schedule_checks(tracker, interval),
+        )
+
+
+def main():
+    host = os.getenv("API_HOST", "0.0.0.0")
+    port = int(os.getenv("API_PORT", "8080"))
+    interval = int(os.getenv("CHECK_INTERVAL", "1800"))
+    history_size = int(os.getenv("API_HISTORY_SIZE", "50"))
+    asyncio.run(serve(host, port, interval, history_size))
+
+
+if __name__ == "__main__":
+    main()